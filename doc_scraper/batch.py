@@ -0,0 +1,210 @@
+import json
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from pathlib import Path
+from PyQt6.QtCore import QObject, pyqtSignal
+from scraper import DocScraper
+from output import save_results
+from transport import make_transport
+from urlstore import split_url
+
+
+class BatchScraper(QObject):
+    """Crawl many sites under one global worker budget.
+
+    Every site gets its own DocScraper for discovery and extraction, but all
+    fetches share a single thread pool. Work is handed out round-robin across
+    hosts, and while several hosts have queued work each one is capped at an
+    even share of the pool (never less than ``per_host_limit``), so one slow
+    or huge site can't starve the others. Once the others run dry, the last
+    host gets the whole pool.
+    """
+    progress_updated = pyqtSignal(int, int)
+    status_updated = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    site_completed = pyqtSignal(str, int)
+    batch_completed = pyqtSignal(dict)
+
+    def __init__(self, start_urls, max_workers: int = 10, per_host_limit: int = 2,
+                 output_dir: str = "output", http2: bool = False):
+        super().__init__()
+        self.max_workers = max_workers
+        # One transport for every site, so HTTP/2 connections are shared per host
+        self.transport = make_transport(http2, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.output_dir = Path(output_dir) / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        # Sites by index, 1-based in input order; finished ones are dropped
+        self.sites = {}
+        self.origins = {}
+        seen = set()
+        for url in start_urls:
+            url = url.strip()
+            if url and url not in seen:
+                seen.add(url)
+                index = len(self.sites) + 1
+                site = DocScraper(url, max_workers, transport=self.transport)
+                site.error_occurred.connect(self.error_occurred)
+                self.sites[index] = site
+                self.origins[index] = split_url(url)[0]
+
+        # Per-host FIFO of (site index, rest of the page URL); rest None means discovery
+        self.queues = {}
+        self.in_flight = {}
+        self.hosts = deque()
+        self.outstanding = {}
+        # Set when a site's first task is handed to a worker
+        self.site_started = {}
+        self.summary = []
+
+    def compact(self, index, url):
+        """Queue form of a page URL: the part after its site's origin"""
+        origin, rest = split_url(url)
+        # Same host, other scheme or port: keep the whole URL
+        return rest if origin == self.origins[index] else origin + rest
+
+    def expand(self, index, rest):
+        return self.origins[index] + rest if rest.startswith('/') else rest
+
+    def enqueue(self, index, page_url=None):
+        host = self.sites[index].base_domain
+        if host not in self.queues:
+            self.queues[host] = deque()
+            self.in_flight[host] = 0
+            self.hosts.append(host)
+        self.queues[host].append((index, None if page_url is None else self.compact(index, page_url)))
+        self.outstanding[index] += 1
+
+    def next_task(self):
+        """Pick the next task round-robin across hosts with spare capacity"""
+        waiting = sum(1 for queue in self.queues.values() if queue)
+        if not waiting:
+            return None
+        limit = max(self.per_host_limit, -(-self.max_workers // waiting))
+        for _ in range(len(self.hosts)):
+            host = self.hosts[0]
+            self.hosts.rotate(-1)
+            if self.queues[host] and self.in_flight[host] < limit:
+                return host, self.queues[host].popleft()
+        return None
+
+    def run_task(self, index, rest):
+        site = self.sites[index]
+        if rest is None:
+            return site.discover_links()
+        return site.process_url(self.expand(index, rest))
+
+    def finish_site(self, index):
+        # Nothing is queued for the site any more; once its files are written
+        # its pages can be freed instead of waiting for the whole batch
+        site = self.sites.pop(index)
+        start_url = site.start_url
+        if site.discovery_error:
+            site.failed_urls.add(start_url)
+        boilerplate_blocks = site.finish_boilerplate()
+        slug = re.sub(r'[^A-Za-z0-9._-]+', '_', re.sub(r'^https?://', '', start_url)).strip('_')
+        json_path, txt_path = save_results(
+            site.text_content, self.output_dir, f"{index:03d}_{slug}"
+        )
+        self.summary.append({
+            'start_url': start_url,
+            'site_type': site.site_type.name,
+            'pages': len(site.text_content),
+            'failed': sorted(site.failed_urls),
+            'discovery_error': site.discovery_error,
+            'boilerplate_blocks': boilerplate_blocks,
+            'elapsed_seconds': round(time.monotonic() - self.site_started[index], 2),
+            'files': [str(json_path), str(txt_path)],
+        })
+        self.status_updated.emit(
+            f"Finished {start_url}: {len(site.text_content)} pages, {len(site.failed_urls)} failed"
+        )
+        site.close_url_sets()
+        self.site_completed.emit(start_url, len(site.text_content))
+
+    def run(self):
+        """Crawl every site and write per-site output plus a run summary"""
+        started = time.monotonic()
+        order = {site.start_url: index for index, site in self.sites.items()}
+        for index in self.sites:
+            self.outstanding[index] = 0
+            self.enqueue(index)
+
+        total_pages = 0
+        processed_pages = 0
+        self.status_updated.emit(
+            f"Starting batch of {len(self.sites)} sites with {self.max_workers} workers..."
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while True:
+                while len(running) < self.max_workers:
+                    task = self.next_task()
+                    if task is None:
+                        break
+                    host, (index, rest) = task
+                    self.in_flight[host] += 1
+                    self.site_started.setdefault(index, time.monotonic())
+                    future = executor.submit(self.run_task, index, rest)
+                    running[future] = (host, index, rest)
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    host, index, rest = running.pop(future)
+                    self.in_flight[host] -= 1
+                    self.outstanding[index] -= 1
+                    site = self.sites[index]
+                    page_url = site.start_url if rest is None else self.expand(index, rest)
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.error_occurred.emit(f"Error processing {page_url}: {str(e)}")
+                        result = None
+
+                    if rest is None:
+                        # Already de-duplicated against the site's visited links
+                        links = result or []
+                        for link in links:
+                            self.enqueue(index, link)
+                        total_pages += len(links)
+                        self.status_updated.emit(f"{page_url}: {len(links)} links discovered")
+                    else:
+                        processed_pages += 1
+                        if result:
+                            site.text_content.append(result)
+                        else:
+                            site.failed_urls.add(page_url)
+                        self.progress_updated.emit(processed_pages, total_pages)
+
+                    if self.outstanding[index] == 0:
+                        self.finish_site(index)
+
+        elapsed = time.monotonic() - started
+        self.transport.close()
+        summary = {
+            'sites': len(order),
+            'pages': sum(entry['pages'] for entry in self.summary),
+            'failed': sum(len(entry['failed']) for entry in self.summary),
+            'elapsed_seconds': round(elapsed, 2),
+            'slowest_site_seconds': max((entry['elapsed_seconds'] for entry in self.summary), default=0),
+            'transport': self.transport.name,
+            'transfer': self.transport.stats.as_dict(),
+            'results': sorted(self.summary, key=lambda entry: order[entry['start_url']]),
+        }
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        summary_path = self.output_dir / "summary.json"
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        summary['summary_file'] = str(summary_path)
+
+        self.status_updated.emit(f"Transfer: {self.transport.stats.summary()}")
+        self.batch_completed.emit(summary)
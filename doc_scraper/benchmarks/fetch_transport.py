@@ -0,0 +1,176 @@
+"""Compare the fetch transports against a local HTTP/2-capable server.
+
+Starts hypercorn on localhost with a throwaway self-signed certificate
+(made with openssl) so clients can pick HTTP/1.1 or HTTP/2 through ALPN.
+The server returns synthetic documentation pages, compressed with zstd, br
+or gzip depending on Accept-Encoding, after a fixed delay per request.
+Every page is then fetched with plain requests.get (the old fetch path),
+RequestsTransport and Http2Transport. Needs hypercorn and
+httpx[http2,brotli,zstd]. Run from the doc_scraper folder:
+
+    python benchmarks/fetch_transport.py [pages] [workers] [delay_ms]
+"""
+import asyncio
+import gzip
+import multiprocessing
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+import urllib3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transport import Http2Transport, RequestsTransport, format_bytes  # noqa: E402
+
+WORDS = (
+    "page site scraper content thread output folder option command worker link "
+    "section heading table list code value default config setting request response "
+    "server client header encoding connection stream document text title index"
+).split()
+
+
+def make_page(index: int) -> bytes:
+    """About 20 KB of HTML that compresses roughly like real documentation"""
+    rng = random.Random(index)
+    sections = "".join(
+        f"<h2>Section {index}.{i}</h2>\n" + "".join(
+            "<p>" + " ".join(rng.choice(WORDS) for _ in range(40)) + ".</p>\n"
+            for _ in range(6)
+        )
+        for i in range(10)
+    )
+    return (
+        f"<html><head><title>Page {index}</title></head><body><main>"
+        f"<h1>Page {index}</h1>{sections}</main></body></html>"
+    ).encode('utf-8')
+
+
+def compressors():
+    # Levels a web server would typically use for on-the-fly compression
+    found = {'gzip': lambda data: gzip.compress(data, compresslevel=6)}
+    try:
+        import brotli
+        found['br'] = lambda data: brotli.compress(data, quality=5)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        found['zstd'] = zstandard.ZstdCompressor(level=3).compress
+    except ImportError:
+        pass
+    return found
+
+
+def serve(port: int, certfile: str, keyfile: str, pages: int, delay: float):
+    from hypercorn.asyncio import serve as hypercorn_serve
+    from hypercorn.config import Config
+
+    available = compressors()
+    bodies = {}
+    for index in range(pages):
+        page = make_page(index)
+        bodies[index] = {'identity': page}
+        for name, compress in available.items():
+            bodies[index][name] = compress(page)
+
+    async def app(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                await send({'type': message['type'] + '.complete'})
+                if message['type'] == 'lifespan.shutdown':
+                    return
+        await asyncio.sleep(delay)
+        index = int(scope['path'].rsplit('/', 1)[-1]) % pages
+        accepted = {
+            token.split(';')[0].strip()
+            for value in (v for k, v in scope['headers'] if k == b'accept-encoding')
+            for token in value.decode().split(',')
+        }
+        encoding = next((name for name in ('zstd', 'br', 'gzip') if name in accepted and name in available),
+                        'identity')
+        body = bodies[index][encoding]
+        headers = [(b'content-type', b'text/html; charset=utf-8'), (b'content-length', str(len(body)).encode())]
+        if encoding != 'identity':
+            headers.append((b'content-encoding', encoding.encode()))
+        await send({'type': 'http.response.start', 'status': 200, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.certfile = certfile
+    config.keyfile = keyfile
+    config.accesslog = None
+    config.errorlog = None
+    asyncio.run(hypercorn_serve(app, config))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(port: int):
+    for _ in range(600):
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Test server did not start")
+
+
+def run(label, fetch, urls, workers, stats=None):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        decoded = sum(len(text) for text in executor.map(fetch, urls))
+    elapsed = time.perf_counter() - started
+    detail = f"{stats.summary()}" if stats else f"{format_bytes(decoded)} of text, wire bytes not measured"
+    print(f"{label:<20} {elapsed:6.2f} s  {len(urls) / elapsed:7.1f} pages/s  {detail}")
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    delay = (int(sys.argv[3]) if len(sys.argv) > 3 else 20) / 1000
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    # Holds the private key; removed with everything else when the run ends
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        certfile, keyfile = str(workdir / 'cert.pem'), str(workdir / 'key.pem')
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+             '-subj', '/CN=localhost', '-keyout', keyfile, '-out', certfile],
+            check=True, capture_output=True
+        )
+
+        port = free_port()
+        server = multiprocessing.Process(
+            target=serve, args=(port, certfile, keyfile, pages, delay), daemon=True
+        )
+        server.start()
+        try:
+            wait_for(port)
+            urls = [f"https://127.0.0.1:{port}/page/{i}" for i in range(pages)]
+            print(f"{pages} pages, {workers} workers, {delay * 1000:.0f} ms server delay\n")
+
+            run("requests.get", lambda url: requests.get(url, timeout=10, verify=False).text, urls, workers)
+
+            for transport in (RequestsTransport(workers, verify=False), Http2Transport(workers, verify=False)):
+                run(transport.name, transport.get, urls, workers, transport.stats)
+                transport.close()
+        finally:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
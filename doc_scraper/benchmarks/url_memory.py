@@ -0,0 +1,64 @@
+"""Measure crawl bookkeeping memory per URL.
+
+Compares a plain set of URL strings with CompactUrlSet, and a per-page dict
+with PageRecord. Run from the doc_scraper folder:
+
+    python benchmarks/url_memory.py [number_of_urls]
+"""
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from urlstore import CompactUrlSet, CACHE_KIB  # noqa: E402
+
+
+def make_urls(count):
+    hosts = [f"https://docs.example{i}.com" for i in range(50)]
+    for i in range(count):
+        yield f"{hosts[i % len(hosts)]}/guide/section-{i // 1000}/page-{i}.html"
+
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, used
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    _, set_bytes = measure(lambda: set(make_urls(count)))
+
+    def build_compact():
+        urls = CompactUrlSet()
+        for url in make_urls(count):
+            urls.add(url)
+        return urls
+
+    compact, compact_bytes = measure(build_compact)
+    # SQLite allocates outside the Python heap; count its page cache cap too
+    compact_total = compact_bytes + CACHE_KIB * 1024
+    disk_bytes = os.path.getsize(compact.path)
+    compact.close()
+
+    print(f"URLs:              {count:,}")
+    print(f"set of str:        {set_bytes / count:8.1f} bytes/URL")
+    print(f"CompactUrlSet:     {compact_total / count:8.1f} bytes/URL in RAM "
+          f"(+{disk_bytes / count:.1f} bytes/URL on disk)")
+    print(f"Reduction:         {set_bytes / compact_total:8.1f}x")
+
+    from scraper import PageRecord
+
+    _, record_bytes = measure(lambda: [PageRecord('', '', '') for _ in range(count)])
+    _, dict_bytes = measure(lambda: [{'url': '', 'title': '', 'content': ''} for _ in range(count)])
+    print(f"dict per page:     {dict_bytes / count:8.1f} bytes/page")
+    print(f"PageRecord:        {record_bytes / count:8.1f} bytes/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import threading
+from bs4 import CData, NavigableString, Tag
+
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'details', 'div', 'dl',
+    'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2',
+    'h3', 'h4', 'h5', 'h6', 'header', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+    'section', 'table', 'td', 'th', 'tr', 'ul'
+}
+
+HEADINGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+
+# Shorter blocks are only boilerplate candidates if they are mostly links
+MIN_BLOCK_CHARS = 40
+
+# Only real text; comments, scripts and styles are other NavigableString types
+TEXT_TYPES = (NavigableString, CData)
+
+
+def split_blocks(root):
+    """Split an element into (fingerprint, text) blocks in document order.
+
+    A block is the text directly inside one block-level element, inline
+    children included. The fingerprint hashes the tag path from the root
+    together with that text, so the same menu in the same place on two pages
+    gets the same fingerprint. Headings and short blocks that are not mostly
+    link text get None instead: "Parameters" or "Example" repeat on every
+    page of an API reference but are content, not chrome.
+    """
+    blocks = []
+
+    def flush(path, buffer):
+        if buffer:
+            text = ' '.join(part for part, _ in buffer)
+            link_chars = sum(len(part) for part, linked in buffer if linked)
+            heading = path.rpartition('/')[2] in HEADINGS
+            if not heading and (len(text) >= MIN_BLOCK_CHARS or link_chars * 2 >= len(text)):
+                blocks.append((hash((path, text)), text))
+            else:
+                blocks.append((None, text))
+            buffer.clear()
+
+    # Explicit stack so deeply nested markup can't hit the recursion limit.
+    # Frames are (children left, tag path, text buffer, inside a link, owns buffer).
+    stack = [(iter(root.children), root.name, [], False, True)]
+    while stack:
+        children, path, buffer, linked, owner = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if owner:
+                flush(path, buffer)
+        elif isinstance(child, Tag):
+            child_linked = linked or child.name == 'a'
+            if child.name in BLOCK_TAGS:
+                flush(path, buffer)
+                stack.append((iter(child.children), f"{path}/{child.name}", [], child_linked, True))
+            else:
+                stack.append((iter(child.children), path, buffer, child_linked, False))
+        elif type(child) in TEXT_TYPES:
+            text = child.strip()
+            if text:
+                buffer.append((text, linked))
+    return blocks
+
+
+class BoilerplateFilter:
+    """Learns site chrome from the first pages of a crawl and drops it.
+
+    The first ``learn_pages`` pages are only observed: every block is
+    fingerprinted and counted once per page. Blocks seen on at least
+    ``threshold`` of those pages are treated as boilerplate and skipped on
+    every later page with a single set lookup. Pages used for learning are
+    cleaned retroactively once the boilerplate set is known.
+    """
+
+    def __init__(self, learn_pages: int = 10, threshold: float = 0.6, min_pages: int = 3):
+        self.learn_pages = learn_pages
+        self.threshold = threshold
+        self.min_pages = min_pages
+        self.page_counts = {}
+        self.pending = []
+        self.blocks = None
+        self.lock = threading.Lock()
+
+    def extract(self, record, root):
+        """Set record.content to the text of root without boilerplate"""
+        blocks = split_blocks(root)
+
+        if self.blocks is None:
+            with self.lock:
+                if self.blocks is None:
+                    record.content = ' '.join(text for _, text in blocks)
+                    for fingerprint in {fingerprint for fingerprint, _ in blocks if fingerprint is not None}:
+                        self.page_counts[fingerprint] = self.page_counts.get(fingerprint, 0) + 1
+                    self.pending.append((record, blocks))
+                    if len(self.pending) >= self.learn_pages:
+                        self.learn()
+                    return
+
+        record.content = ' '.join(text for fingerprint, text in blocks if fingerprint not in self.blocks)
+
+    def learn(self):
+        # Called with the lock held
+        needed = self.threshold * len(self.pending)
+        self.blocks = frozenset(
+            fingerprint for fingerprint, count in self.page_counts.items() if count >= needed
+        )
+        for record, blocks in self.pending:
+            record.content = ' '.join(
+                text for fingerprint, text in blocks if fingerprint not in self.blocks
+            )
+        self.page_counts = {}
+        self.pending = []
+
+    def finish(self) -> int:
+        """Learn from whatever was seen if the crawl ended early.
+
+        Returns the number of boilerplate blocks in use.
+        """
+        with self.lock:
+            if self.blocks is None and len(self.pending) >= self.min_pages:
+                self.learn()
+            return len(self.blocks or ())
@@ -4,8 +4,9 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                            QStyleOptionSpinBox, QCheckBox)
 from PyQt6.QtCore import Qt, QThread
 from scraper import DocScraper
-import json
-from pathlib import Path
+from batch import BatchScraper
+from output import save_results
+from transport import HTTP2_AVAILABLE
 from datetime import datetime
 from PyQt6.QtGui import QPainter, QColor, QPen
 from PyQt6.QtCore import QPointF
@@ -126,6 +127,16 @@ class MainWindow(QMainWindow):
         
         thread_layout.addWidget(thread_label)
         thread_layout.addWidget(self.thread_spinner)
+        
+        # HTTP/2 toggle, only usable when httpx[http2] is installed
+        self.http2_checkbox = QCheckBox("HTTP/2")
+        self.http2_checkbox.setEnabled(HTTP2_AVAILABLE)
+        self.http2_checkbox.setToolTip(
+            "Multiplex all threads over one connection per host"
+            if HTTP2_AVAILABLE else
+            "Install httpx[http2] to enable HTTP/2"
+        )
+        thread_layout.addWidget(self.http2_checkbox)
         thread_layout.addStretch()
         
         # Add discover button
@@ -133,6 +144,12 @@ class MainWindow(QMainWindow):
         self.discover_button.clicked.connect(self.discover_links)
         thread_layout.addWidget(self.discover_button)
         
+        # Add batch button
+        self.batch_button = QPushButton("Batch From File...")
+        self.batch_button.setToolTip("Scrape every start URL listed in a text file, one per line")
+        self.batch_button.clicked.connect(self.start_batch)
+        thread_layout.addWidget(self.batch_button)
+        
         # Add layouts to main layout
         main_layout.addLayout(url_layout)
         main_layout.addLayout(thread_layout)
@@ -189,6 +206,7 @@ class MainWindow(QMainWindow):
         
         # Initialize scraper
         self.scraper = None
+        self.batch_scraper = None
         self.scraper_thread = None
         self.checkboxes = []
 
@@ -199,12 +217,15 @@ class MainWindow(QMainWindow):
             return
             
         self.discover_button.setEnabled(False)
+        self.batch_button.setEnabled(False)
         self.url_input.setEnabled(False)
         self.progress_bar.setValue(0)
         self.log_output.clear()
         
         # Initialize scraper
-        self.scraper = DocScraper(url, self.thread_spinner.value())
+        self.scraper = DocScraper(
+            url, self.thread_spinner.value(), http2=self.http2_checkbox.isChecked()
+        )
         
         # Connect signals
         self.scraper.status_updated.connect(self.log_message)
@@ -213,6 +234,53 @@ class MainWindow(QMainWindow):
         
         # Start discovery in separate thread
         self.scraper_thread = ScraperThread(self.scraper)  # Uses default discover_links
+        self.scraper_thread.finished.connect(self.discovery_finished)
+        self.scraper_thread.start()
+
+    def discovery_finished(self):
+        self.batch_button.setEnabled(True)
+
+    def start_batch(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open URL List", "", "Text Files (*.txt);;All Files (*)"
+        )
+        if not path:
+            return
+        
+        with open(path, encoding='utf-8') as f:
+            urls = [
+                line.strip() for line in f
+                if line.strip() and not line.strip().startswith('#')
+            ]
+        
+        if not urls:
+            self.log_message("No URLs found in the selected file")
+            return
+        
+        self.discover_button.setEnabled(False)
+        self.batch_button.setEnabled(False)
+        self.start_button.setEnabled(False)
+        self.url_input.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.log_output.clear()
+        
+        self.batch_scraper = BatchScraper(
+            urls, self.thread_spinner.value(), http2=self.http2_checkbox.isChecked()
+        )
+        
+        # Connect signals
+        self.batch_scraper.status_updated.connect(self.log_message)
+        self.batch_scraper.error_occurred.connect(self.log_message)
+        self.batch_scraper.progress_updated.connect(self.update_progress)
+        self.batch_scraper.batch_completed.connect(self.handle_batch_completion)
+        
+        # Start batch in separate thread
+        self.scraper_thread = ScraperThread(
+            self.batch_scraper,
+            method_to_run=self.batch_scraper.run
+        )
+        self.scraper_thread.finished.connect(self.batch_finished)
         self.scraper_thread.start()
 
     def show_link_selection(self, links):
@@ -259,6 +327,7 @@ class MainWindow(QMainWindow):
             return
             
         self.start_button.setEnabled(False)
+        self.batch_button.setEnabled(False)
         self.scroll_area.setEnabled(False)
         self.select_buttons_widget.setEnabled(False)
         
@@ -284,32 +353,30 @@ class MainWindow(QMainWindow):
         self.log_output.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
 
     def handle_completion(self, content):
-        # Create output directory
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        
         # Save files
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_name = f"scrape_{timestamp}"
-        
-        # Save JSON
-        json_path = output_dir / f"{base_name}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, ensure_ascii=False, indent=2)
-        
-        # Save TXT
-        txt_path = output_dir / f"{base_name}.txt"
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            for item in content:
-                f.write(f"Title: {item['title']}\n")
-                f.write(f"URL: {item['url']}\n\n")
-                f.write(item['content'])
-                f.write("\n\n" + "=" * 80 + "\n\n")
+        json_path, txt_path = save_results(content, "output", f"scrape_{timestamp}")
         
         self.log_message(f"Files saved:\n{json_path}\n{txt_path}")
 
+    def handle_batch_completion(self, summary):
+        self.log_message(
+            f"Batch finished: {summary['sites']} sites, {summary['pages']} pages, "
+            f"{summary['failed']} failed in {summary['elapsed_seconds']}s "
+            f"(slowest site {summary['slowest_site_seconds']}s)"
+        )
+        self.log_message(f"Summary saved:\n{summary['summary_file']}")
+
+    def batch_finished(self):
+        self.discover_button.setEnabled(True)
+        self.batch_button.setEnabled(True)
+        self.start_button.setEnabled(True)
+        self.url_input.setEnabled(True)
+        self.statusBar().showMessage("Batch completed")
+
     def scraping_finished(self):
         self.start_button.setEnabled(True)
+        self.batch_button.setEnabled(True)
         self.scroll_area.setEnabled(True)
         self.select_all_button.setEnabled(True)
         self.deselect_all_button.setEnabled(True)
@@ -0,0 +1,24 @@
+import json
+from pathlib import Path
+
+
+def save_results(content, output_dir, base_name):
+    """Write scraped pages to <base_name>.json and <base_name>.txt"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Save JSON
+    json_path = output_dir / f"{base_name}.json"
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump([item.to_dict() for item in content], f, ensure_ascii=False, indent=2)
+
+    # Save TXT
+    txt_path = output_dir / f"{base_name}.txt"
+    with open(txt_path, 'w', encoding='utf-8') as f:
+        for item in content:
+            f.write(f"Title: {item.title}\n")
+            f.write(f"URL: {item.url}\n\n")
+            f.write(item.content)
+            f.write("\n\n" + "=" * 80 + "\n\n")
+
+    return json_path, txt_path
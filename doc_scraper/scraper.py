@@ -1,8 +1,29 @@
-import requests
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 from PyQt6.QtCore import QObject, pyqtSignal
+from urlstore import CompactUrlSet, normalize_url
+from boilerplate import BoilerplateFilter
+from sites import GENERIC, detect_site_type, parse_head
+from transport import make_transport
+
+
+class PageRecord:
+    """Scraped page; slots instead of a per-page dict"""
+    __slots__ = ('url', 'title', 'content')
+
+    def __init__(self, url: str, title: str, content: str):
+        self.url = url
+        self.title = title
+        self.content = content
+
+    def to_dict(self) -> dict:
+        return {
+            'url': self.url,
+            'title': self.title,
+            'content': self.content
+        }
+
 
 class DocScraper(QObject):
     progress_updated = pyqtSignal(int, int)
@@ -11,114 +32,48 @@ class DocScraper(QObject):
     error_occurred = pyqtSignal(str)
     links_discovered = pyqtSignal(list)
 
-    def __init__(self, start_url: str, max_workers: int = 5):
+    def __init__(self, start_url: str, max_workers: int = 5, http2: bool = False, transport=None):
         super().__init__()
         self.start_url = start_url
         self.max_workers = max_workers
+        # A transport passed in is shared (batch mode) and closed by its owner
+        self.owns_transport = transport is None
+        self.transport = transport or make_transport(http2, max_workers)
         self.base_domain = urlparse(start_url).netloc
-        self.visited_links = set()
-        self.failed_urls = set()
+        self.visited_links = CompactUrlSet()
+        self.failed_urls = CompactUrlSet()
         self.text_content = []
-        self.is_wordpress = False
-
-    def detect_wordpress(self, soup):
-        """Detect if the site is WordPress"""
-        # Check meta generator tag
-        meta = soup.find('meta', {'name': 'generator'})
-        if meta and 'wordpress' in meta.get('content', '').lower():
-            return True
-        
-        # Check for wp-content directory in links
-        if soup.find('link', href=lambda x: x and 'wp-content' in x.lower()):
-            return True
-            
-        # Check for common WordPress classes
-        wp_classes = ['wp-content', 'wordpress', 'wp-block']
-        for class_name in wp_classes:
-            if soup.find(class_=class_name):
-                return True
-        
-        return False
+        self.site_type = GENERIC
+        self.discovery_error = None
+        self.boilerplate = BoilerplateFilter()
 
-    def get_wordpress_content(self, soup):
-        """Extract content from WordPress pages"""
-        content = []
-        
-        # Get the main content container
-        content_area = soup.select_one('div.post-content')
-        if not content_area:
-            content_area = soup.select_one('.entry-content, article, .wp-block-post-content')
-            
-        if content_area:
-            # Extract and clean up tables
-            for table in content_area.find_all('table'):
-                # Get headers
-                headers = []
-                for th in table.find_all('th'):
-                    headers.append(th.get_text(strip=True))
-                
-                # Get rows
-                rows = []
-                for tr in table.find_all('tr'):
-                    cells = [td.get_text(strip=True) for td in tr.find_all('td')]
-                    if cells:  # Only add rows with actual data
-                        rows.append(cells)
-                
-                if headers and rows:
-                    content.append("\n".join([
-                        " | ".join(headers),
-                        "-" * (sum(len(h) for h in headers) + (3 * (len(headers) - 1))),
-                        *[" | ".join(row) for row in rows]
-                    ]))
-            
-            # Extract headings and paragraphs
-            for element in content_area.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']):
-                text = element.get_text(strip=True)
-                if text:
-                    # Add proper formatting for headings
-                    if element.name.startswith('h'):
-                        level = int(element.name[1])
-                        text = f"{'#' * level} {text}"
-                    content.append(text)
-            
-            # Extract lists
-            for list_elem in content_area.find_all(['ul', 'ol']):
-                for item in list_elem.find_all('li'):
-                    text = item.get_text(strip=True)
-                    if text:
-                        content.append(f"- {text}")
-        
-        return "\n\n".join(content)
-
-    def discover_links(self):
+    def discover_links(self) -> list:
         """First step: just get all available links"""
         try:
             self.status_updated.emit("Discovering available links...")
-            response = requests.get(self.start_url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            html = self.transport.get(self.start_url)
             
-            # Detect if it's a WordPress site
-            self.is_wordpress = self.detect_wordpress(soup)
-            self.status_updated.emit(
-                f"{'WordPress' if self.is_wordpress else 'Generic'} site detected"
-            )
+            # Detect the documentation framework from the page head
+            self.site_type = detect_site_type(parse_head(html))
+            self.status_updated.emit(f"{self.site_type.name} site detected")
             
-            links = self.get_links(self.start_url)
-            self.links_discovered.emit(list(links))
+            # Reuse the page already fetched for detection
+            links = self.get_links(self.start_url, html)
+            self.links_discovered.emit(links)
+            return links
             
         except Exception as e:
+            self.discovery_error = str(e)
             self.error_occurred.emit(f"Error discovering links: {str(e)}")
+            return []
 
-    def get_links(self, url: str) -> set:
-        """Extract all valid links from a page"""
+    def get_links(self, url: str, html: str = None) -> list:
+        """Extract all valid links from a page that haven't been seen yet"""
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            links = set()
+            if html is None:
+                html = self.transport.get(url)
+            soup = BeautifulSoup(html, 'html.parser')
+            links = []
             
             # Get all links from the page
             for link in soup.find_all('a', href=True):
@@ -132,48 +87,52 @@ class DocScraper(QObject):
                         'wp-admin', 'wp-json', 'wp-includes', 'xmlrpc',
                         'wp-login', 'feed', '?', '#comment', 'replytocom'
                     ]):
-                        links.add(absolute_url)
+                        # De-duplicated through the compact set, not a set of strings
+                        absolute_url = normalize_url(absolute_url)
+                        if self.visited_links.add(absolute_url):
+                            links.append(absolute_url)
             
             return links
             
         except Exception as e:
             self.error_occurred.emit(f"Error getting links from {url}: {str(e)}")
-            return set()
+            return []
 
-    def process_url(self, url: str) -> dict:
+    def process_url(self, url: str) -> PageRecord:
         """Process a single URL and extract its content"""
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            html = self.transport.get(url)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Get the title as a plain str; a NavigableString would keep the parsed tree alive
+            head = parse_head(html)
+            title = str(head.title.string) if head.title and head.title.string else url
             
-            # Get the title
-            title = soup.title.string if soup.title else url
+            record = PageRecord(url, title, '')
             
-            # Get the main content based on site type
-            if self.is_wordpress:
-                content = self.get_wordpress_content(soup)
+            # Get the main content from the framework's own container
+            content = self.site_type.extract(html)
+            if content is not None:
+                record.content = content
             else:
-                # Generic content extraction
+                # Generic content extraction, minus blocks repeated across pages
+                soup = BeautifulSoup(html, 'html.parser')
                 main_content = soup.find('main') or soup.find('article') or soup.find('body')
-                content = ' '.join(main_content.stripped_strings) if main_content else ''
+                if main_content:
+                    self.boilerplate.extract(record, main_content)
             
-            return {
-                'url': url,
-                'title': title,
-                'content': content
-            }
+            return record
         except Exception as e:
             self.error_occurred.emit(f"Error processing {url}: {str(e)}")
             return None
 
     def scrape_selected(self, selected_urls):
         """Scrape only the selected URLs"""
-        processed_urls = set()
+        processed = 0
         total_urls = len(selected_urls)
 
         self.status_updated.emit("Starting scraping process...")
+        # The transport outlives a run; report this run's transfer only
+        self.transport.stats.reset()
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_url = {
@@ -187,11 +146,30 @@ class DocScraper(QObject):
                     result = future.result()
                     if result:
                         self.text_content.append(result)
-                    processed_urls.add(url)
-                    self.progress_updated.emit(len(processed_urls), total_urls)
+                    else:
+                        self.failed_urls.add(url)
+                    processed += 1
+                    self.progress_updated.emit(processed, total_urls)
                     self.status_updated.emit(f"Processing: {url}")
                 except Exception as e:
                     self.error_occurred.emit(f"Error processing {url}: {str(e)}")
                     self.failed_urls.add(url)
 
-        self.scraping_completed.emit(self.text_content)
\ No newline at end of file
+        self.finish_boilerplate()
+        self.status_updated.emit(f"Transfer: {self.transport.stats.summary()}")
+        if self.owns_transport:
+            self.transport.close()
+        self.close_url_sets()
+        self.scraping_completed.emit(self.text_content)
+
+    def close_url_sets(self):
+        """Release the URL sets' temp files and SQLite page caches"""
+        self.visited_links.close()
+        self.failed_urls.close()
+
+    def finish_boilerplate(self) -> int:
+        """Settle the boilerplate filter once all pages are in"""
+        removed = self.boilerplate.finish()
+        if removed:
+            self.status_updated.emit(f"Removed {removed} repeated blocks (navigation, footers, etc.)")
+        return removed
\ No newline at end of file
@@ -10,4 +10,7 @@ setup(
         'beautifulsoup4>=4.11.0',
         'tqdm>=4.65.0',
     ],
+    extras_require={
+        'http2': ['httpx[http2,brotli,zstd]>=0.27.1'],
+    },
 ) 
\ No newline at end of file
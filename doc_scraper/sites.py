@@ -0,0 +1,312 @@
+import re
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+HEAD_END = re.compile(r'</head\s*>', re.IGNORECASE)
+ATTR = re.compile(r'''([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''')
+HEADINGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+INLINE_TAGS = {
+    'a', 'abbr', 'b', 'br', 'cite', 'code', 'em', 'i', 'img', 'kbd', 'mark',
+    'q', 's', 'samp', 'small', 'span', 'strong', 'sub', 'sup', 'time', 'u', 'var'
+}
+# Spans whose contents are not markup; an unterminated one runs to the end
+OPAQUE = r'<!--.*?(?:-->|$)|<script\b.*?(?:</script\s*>|$)|<style\b.*?(?:</style\s*>|$)'
+SKIP_TAGS = {'button', 'form', 'iframe', 'nav', 'noscript', 'script', 'style', 'svg', 'template'}
+
+
+def parse_head(html: str) -> BeautifulSoup:
+    """Parse only the <head> of a page; enough for the title and detection"""
+    match = HEAD_END.search(html)
+    return BeautifulSoup(html[:match.end()] if match else html, 'html.parser')
+
+
+class Container:
+    """Finds one element in raw HTML without parsing the rest of the page"""
+
+    def __init__(self, name: str, attrs: dict):
+        self.attrs = attrs
+        # Comments, scripts and styles match as a whole so tags inside them
+        # are never counted; group 1 is None for those
+        flags = re.IGNORECASE | re.DOTALL
+        self.start = re.compile(rf'{OPAQUE}|(<{name}\b[^>]*>)', flags)
+        self.tags = re.compile(rf'{OPAQUE}|<(/?){name}\b[^>]*>', flags)
+
+    def matches(self, tag: str) -> bool:
+        if any(value not in tag for value in self.attrs.values()):
+            return False
+        found = {
+            key.lower(): next(value for value in values if value)
+            for key, *values in ATTR.findall(tag)
+            if any(values)
+        }
+        for key, value in self.attrs.items():
+            if key == 'class':
+                if value not in found.get('class', '').split():
+                    return False
+            elif found.get(key) != value:
+                return False
+        return True
+
+    def find(self, html: str):
+        """Raw HTML of the first matching element, or None"""
+        for match in self.start.finditer(html):
+            if match.group(1) is None or not self.matches(match.group(1)):
+                continue
+            depth = 1
+            for tag in self.tags.finditer(html, match.end()):
+                if tag.group(1) is None:
+                    continue
+                depth += -1 if tag.group(1) else 1
+                if depth == 0:
+                    return html[match.start():tag.end()]
+            # Never closed; take the rest of the page
+            return html[match.start():]
+        return None
+
+
+def squash(text: str) -> str:
+    return ' '.join(text.split())
+
+
+def render_table(table) -> str:
+    rows = []
+    for tr in table.find_all('tr'):
+        cells = [squash(cell.get_text(' ')) for cell in tr.find_all(['th', 'td'])]
+        if any(cells):
+            rows.append(cells)
+    if not rows:
+        return ''
+    lines = [" | ".join(rows[0]), " | ".join("---" for _ in rows[0])]
+    lines.extend(" | ".join(row) for row in rows[1:])
+    return "\n".join(lines)
+
+
+def render_list(list_elem, depth: int = 0) -> list:
+    items = []
+    # Explicit stack of (items left, depth), like the walk in to_markdown
+    stack = [(iter(list_elem.find_all('li', recursive=False)), depth)]
+    while stack:
+        lis, depth = stack[-1]
+        li = next(lis, None)
+        if li is None:
+            stack.pop()
+            continue
+        nested = li.find_all(['ul', 'ol'], recursive=False)
+        for child in nested:
+            child.extract()
+        text = squash(li.get_text(' '))
+        if text:
+            items.append(f"{'  ' * depth}- {text}")
+        # Pushed last to first so the first nested list comes out first
+        for child in reversed(nested):
+            stack.append((iter(child.find_all('li', recursive=False)), depth + 1))
+    return items
+
+
+def to_markdown(container) -> str:
+    """Render a content container as Markdown-ish text in document order"""
+    blocks = []
+    lines = []
+    buffer = []
+
+    def end_line():
+        # Separate text pieces like get_text(' ') does; squash drops the extras
+        line = squash(' '.join(buffer))
+        if line:
+            lines.append(line)
+        buffer.clear()
+
+    def flush():
+        end_line()
+        if lines:
+            blocks.append("\n".join(lines))
+        lines.clear()
+
+    # Explicit stack so deeply nested markup can't hit the recursion limit.
+    # Frames are (children left, block element to flush when done).
+    stack = [(iter(container.children), True)]
+    while stack:
+        children, block = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if block:
+                flush()
+            continue
+        if isinstance(child, NavigableString):
+            if type(child) is NavigableString:
+                buffer.append(str(child))
+            continue
+        if not isinstance(child, Tag) or child.name in SKIP_TAGS:
+            continue
+        name = child.name
+        if name == 'br':
+            end_line()
+            continue
+        if name in INLINE_TAGS:
+            stack.append((iter(child.children), False))
+            continue
+
+        flush()
+        if name in HEADINGS:
+            text = squash(child.get_text(' '))
+            if text:
+                blocks.append(f"{'#' * int(name[1])} {text}")
+        elif name == 'pre':
+            code = child.get_text().strip('\n')
+            if code.strip():
+                blocks.append(f"```\n{code}\n```")
+        elif name in ('ul', 'ol'):
+            items = render_list(child)
+            if items:
+                blocks.append("\n".join(items))
+        elif name == 'table':
+            table = render_table(child)
+            if table:
+                blocks.append(table)
+        else:
+            stack.append((iter(child.children), True))
+
+    return "\n\n".join(blocks)
+
+
+class SiteType:
+    """A documentation framework: how to spot it and where its content lives.
+
+    Detection only looks at the page head: the generator meta tag and the
+    URLs of linked stylesheets and scripts. Extraction cuts the first
+    matching content container out of the raw HTML and parses only that.
+    """
+    name = 'Generic'
+    generators = ()
+    assets = ()
+    # (tag name, attrs) pairs of content containers, most specific first
+    containers = ()
+    # CSS selectors removed from the container (permalinks, edit buttons)
+    remove = ()
+
+    def __init__(self):
+        self.finders = [Container(name, attrs) for name, attrs in self.containers]
+
+    def detect(self, generator: str, assets: str) -> bool:
+        return (
+            any(name in generator for name in self.generators)
+            or any(path in assets for path in self.assets)
+        )
+
+    def extract(self, html: str):
+        """Content of the page as text, or None if no container matched"""
+        for finder in self.finders:
+            fragment = finder.find(html)
+            if fragment is None:
+                continue
+            soup = BeautifulSoup(fragment, 'html.parser')
+            for selector in self.remove:
+                for element in soup.select(selector):
+                    element.decompose()
+            content = to_markdown(soup)
+            if content:
+                return content
+        return None
+
+
+class ReadTheDocs(SiteType):
+    name = 'ReadTheDocs'
+    assets = ('readthedocs', '_static/css/theme.css', '_static/js/theme.js')
+    containers = (
+        ('div', {'itemprop': 'articleBody'}),
+        ('div', {'role': 'main'}),
+    )
+    remove = ('a.headerlink', '.rst-footer-buttons')
+
+
+class Sphinx(SiteType):
+    name = 'Sphinx'
+    generators = ('sphinx',)
+    assets = ('_static/documentation_options.js', '_static/doctools.js')
+    containers = (
+        ('div', {'itemprop': 'articleBody'}),
+        ('div', {'role': 'main'}),
+        ('div', {'class': 'body'}),
+    )
+    remove = ('a.headerlink', '.rst-footer-buttons')
+
+
+class MkDocs(SiteType):
+    name = 'MkDocs'
+    generators = ('mkdocs',)
+    assets = ('assets/stylesheets/main', 'assets/javascripts/bundle')
+    containers = (
+        ('article', {'class': 'md-content__inner'}),
+        ('div', {'role': 'main'}),
+    )
+    remove = ('a.headerlink', 'a.md-content__button', '.md-source-file')
+
+
+class Docusaurus(SiteType):
+    name = 'Docusaurus'
+    generators = ('docusaurus',)
+    assets = ('runtime~main',)
+    containers = (
+        ('div', {'class': 'theme-doc-markdown'}),
+        ('div', {'class': 'markdown'}),
+        ('article', {}),
+    )
+    remove = ('a.hash-link',)
+
+
+class GitBook(SiteType):
+    name = 'GitBook'
+    generators = ('gitbook',)
+    assets = ('gitbook',)
+    containers = (
+        ('section', {'class': 'markdown-section'}),
+        ('main', {}),
+    )
+
+
+class WordPress(SiteType):
+    name = 'WordPress'
+    generators = ('wordpress',)
+    assets = ('wp-content', 'wp-includes')
+    containers = (
+        ('div', {'class': 'post-content'}),
+        ('div', {'class': 'entry-content'}),
+        ('div', {'class': 'wp-block-post-content'}),
+        ('article', {}),
+    )
+    remove = ('.sharedaddy', '.jp-relatedposts')
+
+
+GENERIC = SiteType()
+
+# Checked in order, first match wins
+SITE_TYPES = [ReadTheDocs(), Sphinx(), MkDocs(), Docusaurus(), GitBook(), WordPress()]
+
+
+def register_site_type(site_type: SiteType, first: bool = False):
+    """Add a framework to the registry, ahead of the built-ins if first"""
+    if first:
+        SITE_TYPES.insert(0, site_type)
+    else:
+        SITE_TYPES.append(site_type)
+
+
+def detect_site_type(head) -> SiteType:
+    """Framework of a site, detected from the parsed head of its start page.
+
+    Nothing is cached here; each crawl detects once and keeps the result,
+    so two projects on one host can be different frameworks.
+    """
+    generator = ' '.join(
+        meta.get('content', '') for meta in head.find_all('meta', attrs={'name': 'generator'})
+    ).lower()
+    assets = ' '.join(
+        tag.get('href') or tag.get('src') or '' for tag in head.find_all(['link', 'script'])
+    ).lower()
+    # Generator meta is explicit, so it wins over any asset heuristic: a
+    # Docusaurus site hosted on Read the Docs still loads readthedocs scripts
+    for candidate_assets in ('', assets):
+        for site_type in SITE_TYPES:
+            if site_type.detect(generator, candidate_assets):
+                return site_type
+    return GENERIC
@@ -0,0 +1,156 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import httpx
+    import h2  # noqa: F401  httpx needs it for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTP2_AVAILABLE = False
+
+TIMEOUT = 10
+
+
+def format_bytes(count: int) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if count < 1024 or unit == 'GB':
+            return f"{count:.0f} {unit}" if unit == 'B' else f"{count:.1f} {unit}"
+        count /= 1024
+
+
+class TransferStats:
+    """Bytes on the wire against decoded bytes, summed over a run"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.responses = 0
+            self.wire_bytes = 0
+            self.decoded_bytes = 0
+            self.encodings = {}
+            self.http_versions = {}
+
+    def record(self, wire_bytes: int, decoded_bytes: int, encoding: str, http_version: str):
+        with self.lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+            self.http_versions[http_version] = self.http_versions.get(http_version, 0) + 1
+
+    def as_dict(self) -> dict:
+        with self.lock:
+            return {
+                'responses': self.responses,
+                'wire_bytes': self.wire_bytes,
+                'decoded_bytes': self.decoded_bytes,
+                'encodings': dict(self.encodings),
+                'http_versions': dict(self.http_versions),
+            }
+
+    def summary(self) -> str:
+        stats = self.as_dict()
+        ratio = stats['decoded_bytes'] / max(stats['wire_bytes'], 1)
+        encodings = ', '.join(f"{name} {count}" for name, count in sorted(stats['encodings'].items()))
+        versions = ', '.join(f"{name} {count}" for name, count in sorted(stats['http_versions'].items()))
+        return (
+            f"{stats['responses']} responses, {format_bytes(stats['wire_bytes'])} on the wire, "
+            f"{format_bytes(stats['decoded_bytes'])} decoded ({ratio:.1f}x); "
+            f"encodings: {encodings or 'none'}; {versions or 'no requests'}"
+        )
+
+
+class RequestsTransport:
+    """HTTP/1.1 over a shared requests session, one connection per worker"""
+    name = 'HTTP/1.1'
+
+    def __init__(self, max_workers: int = 5, verify: bool = True):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Only ask for encodings urllib3 can actually decode here
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        # Passed per request; requests lets REQUESTS_CA_BUNDLE override session.verify
+        self.verify = verify
+        self.stats = TransferStats()
+
+    def get(self, url: str) -> str:
+        response = self.session.get(url, timeout=TIMEOUT, verify=self.verify)
+        response.raise_for_status()
+        # urllib3 decompresses chunk by chunk; tell() counts the raw bytes read
+        self.stats.record(
+            response.raw.tell(),
+            len(response.content),
+            response.headers.get('Content-Encoding', 'identity'),
+            'HTTP/1.1'
+        )
+        return response.text
+
+    def close(self):
+        # The session opens new connections if it is used again
+        self.session.close()
+
+
+class Http2Transport:
+    """HTTP/2 over httpx, multiplexing all workers on one connection per host"""
+    name = 'HTTP/2'
+
+    def __init__(self, max_workers: int = 5, verify: bool = True, prior_knowledge: bool = False):
+        if not HTTP2_AVAILABLE:
+            raise ImportError("HTTP/2 support needs httpx with h2: pip install 'httpx[http2]'")
+        self.max_workers = max_workers
+        self.verify = verify
+        self.prior_knowledge = prior_knowledge
+        self.client = None
+        self.lock = threading.Lock()
+        self.stats = TransferStats()
+
+    def connect(self):
+        # Opened on first use and again after close(), so a scraper can be rerun
+        with self.lock:
+            if self.client is None:
+                # HTTP/2 is negotiated through TLS; prior_knowledge speaks it over plain http:// too
+                self.client = httpx.Client(
+                    http1=not self.prior_knowledge,
+                    http2=True,
+                    verify=self.verify,
+                    timeout=TIMEOUT,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=max(self.max_workers, 10)),
+                )
+            return self.client
+
+    def get(self, url: str) -> str:
+        with self.connect().stream('GET', url) as response:
+            response.raise_for_status()
+            # httpx sends Accept-Encoding for every decoder installed
+            # (gzip, deflate, br with brotli, zstd with zstandard) and
+            # decompresses while streaming
+            body = b''.join(response.iter_bytes())
+            self.stats.record(
+                response.num_bytes_downloaded,
+                len(body),
+                response.headers.get('Content-Encoding', 'identity'),
+                response.http_version
+            )
+            return body.decode(response.encoding or 'utf-8', errors='replace')
+
+    def close(self):
+        with self.lock:
+            if self.client is not None:
+                self.client.close()
+                self.client = None
+
+
+def make_transport(http2: bool = False, max_workers: int = 5, verify: bool = True):
+    """HTTP/2 transport if asked for and installed, HTTP/1.1 otherwise"""
+    if http2 and HTTP2_AVAILABLE:
+        return Http2Transport(max_workers, verify)
+    return RequestsTransport(max_workers, verify)
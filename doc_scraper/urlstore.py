@@ -0,0 +1,186 @@
+import hashlib
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+# Page cache cap for the on-disk store, in KiB (negative means KiB to SQLite)
+CACHE_KIB = 2048
+
+
+def split_url(url: str):
+    """Normalize a URL and split it into its origin and the rest.
+
+    Scheme and host are lower-cased, default ports and fragments are dropped
+    and an empty path becomes '/'.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    host, sep, port = netloc.rpartition(':')
+    if sep and DEFAULT_PORTS.get(scheme) == port:
+        netloc = host
+    rest = urlunsplit(('', '', parts.path or '/', parts.query, ''))
+    return f"{scheme}://{netloc}", rest
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form used for de-duplication"""
+    origin, rest = split_url(url)
+    return origin + rest
+
+
+def hash_pair(key: bytes):
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter, probed with the two halves of one hash_pair"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, hashes):
+        h1, h2 = hashes
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, hashes):
+        bits = self.bits
+        for pos in self.positions(hashes):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, hashes) -> bool:
+        bits = self.bits
+        for pos in self.positions(hashes):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+class CompactUrlSet:
+    """Set of URLs that keeps almost nothing in RAM.
+
+    URLs are normalized and split into an interned origin id plus the rest of
+    the URL. Membership is checked against Bloom filters first; only a
+    "maybe" falls through to the exact store, an SQLite file on disk. When a
+    filter fills up, a new one with twice the capacity and half the false
+    positive rate is added, so the combined rate stays under twice
+    ``error_rate`` however large the crawl grows. Results are always exact.
+    """
+
+    def __init__(self, capacity: int = 10_000, error_rate: float = 0.01, directory=None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.directory = directory
+        self.path = None
+        self.db = None
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.filters = [BloomFilter(self.capacity, self.error_rate)]
+        self.origins = []
+        self.origin_ids = {}
+        self.count = 0
+
+    def connect(self):
+        # The database is only created once something is stored
+        if self.db is None:
+            fd, self.path = tempfile.mkstemp(prefix='doc_scraper_', suffix='.db', dir=self.directory)
+            os.close(fd)
+            self.db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            self.db.execute('PRAGMA journal_mode=OFF')
+            self.db.execute('PRAGMA synchronous=OFF')
+            self.db.execute(f'PRAGMA cache_size=-{CACHE_KIB}')
+            self.db.execute(
+                'CREATE TABLE urls (origin INTEGER NOT NULL, rest TEXT NOT NULL, '
+                'PRIMARY KEY (origin, rest)) WITHOUT ROWID'
+            )
+        return self.db
+
+    def maybe_contains(self, hashes) -> bool:
+        return any(hashes in bloom for bloom in self.filters)
+
+    def stored(self, origin: str, rest: str) -> bool:
+        origin_id = self.origin_ids.get(origin)
+        if origin_id is None or self.db is None:
+            return False
+        row = self.db.execute(
+            'SELECT 1 FROM urls WHERE origin = ? AND rest = ?', (origin_id, rest)
+        ).fetchone()
+        return row is not None
+
+    def add(self, url: str) -> bool:
+        """Add a URL, returning True if it had not been seen before"""
+        origin, rest = split_url(url)
+        hashes = hash_pair((origin + rest).encode('utf-8'))
+
+        with self.lock:
+            if self.maybe_contains(hashes) and self.stored(origin, rest):
+                return False
+
+            origin_id = self.origin_ids.get(origin)
+            if origin_id is None:
+                origin_id = self.origin_ids[origin] = len(self.origins)
+                self.origins.append(origin)
+            self.connect().execute('INSERT INTO urls VALUES (?, ?)', (origin_id, rest))
+
+            bloom = self.filters[-1]
+            if bloom.count >= bloom.capacity:
+                bloom = BloomFilter(bloom.capacity * 2, self.error_rate / 2 ** len(self.filters))
+                self.filters.append(bloom)
+            bloom.add(hashes)
+            self.count += 1
+            return True
+
+    def update(self, urls):
+        for url in urls:
+            self.add(url)
+
+    def __contains__(self, url: str) -> bool:
+        origin, rest = split_url(url)
+        hashes = hash_pair((origin + rest).encode('utf-8'))
+        with self.lock:
+            return self.maybe_contains(hashes) and self.stored(origin, rest)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        with self.lock:
+            rows = self.db.execute('SELECT origin, rest FROM urls').fetchall() if self.db else []
+        for origin_id, rest in rows:
+            yield self.origins[origin_id] + rest
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held in RAM, excluding SQLite's bounded page cache"""
+        return (
+            sum(len(bloom.bits) for bloom in self.filters)
+            + sum(len(origin) for origin in self.origins)
+        )
+
+    def close(self):
+        """Delete the on-disk store; the set is empty afterwards"""
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
+                os.remove(self.path)
+            self.reset()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
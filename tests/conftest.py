@@ -0,0 +1,48 @@
+import sys
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# The app imports its modules flat (`from scraper import DocScraper`)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "doc_scraper"))
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    def __init__(self, pages, *args, **kwargs):
+        self.pages = pages
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        body = self.pages.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        body = f"<html><head><title>{self.path}</title></head><body>{body}</body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def serve():
+    """Start local sites from {path: body html} dicts, returning their root URLs"""
+    servers = []
+
+    def start(pages):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(SiteHandler, pages))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}/"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,129 @@
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("bs4")
+
+from batch import BatchScraper  # noqa: E402
+
+
+def make_batch(per_host_limit=1, max_workers=10, pages=(3, 3, 3)):
+    batch = BatchScraper(
+        ["https://a.example.com/", "https://b.example.com/", "https://c.example.com/"],
+        max_workers=max_workers, per_host_limit=per_host_limit
+    )
+    for (index, site), count in zip(batch.sites.items(), pages):
+        batch.outstanding[index] = 0
+        for i in range(count):
+            batch.enqueue(index, f"{site.start_url}page{i}")
+    return batch
+
+
+def dispatch(batch, running):
+    """Hand out tasks the way run() does, until the pool or the queues are full"""
+    while running < batch.max_workers:
+        task = batch.next_task()
+        if task is None:
+            break
+        batch.in_flight[task[0]] += 1
+        running += 1
+    return running
+
+
+def test_next_task_rotates_across_hosts():
+    batch = make_batch(per_host_limit=5)
+    hosts = [batch.next_task()[0] for _ in range(6)]
+    assert hosts == ["a.example.com", "b.example.com", "c.example.com"] * 2
+
+
+def test_next_task_respects_per_host_limit():
+    batch = make_batch(per_host_limit=1, max_workers=3)
+    picked = []
+    while True:
+        task = batch.next_task()
+        if task is None:
+            break
+        host, _ = task
+        batch.in_flight[host] += 1
+        picked.append(host)
+
+    # One worker per host, the rest waits even though the pool has room
+    assert sorted(picked) == ["a.example.com", "b.example.com", "c.example.com"]
+
+    batch.in_flight["b.example.com"] -= 1
+    host, (index, rest) = batch.next_task()
+    assert host == "b.example.com"
+    assert (index, rest) == (2, "/page1")
+    assert batch.expand(index, rest) == "https://b.example.com/page1"
+    batch.in_flight[host] += 1
+    assert batch.next_task() is None
+
+
+def test_queue_entries_store_the_url_after_the_site_origin():
+    batch = make_batch()
+    assert batch.compact(1, "HTTPS://a.example.com:443/guide/x#top") == "/guide/x"
+    # Same host on another scheme keeps its origin
+    assert batch.compact(1, "http://a.example.com/guide/x") == "http://a.example.com/guide/x"
+    for rest in ("/guide/x", "http://a.example.com/guide/x"):
+        assert batch.compact(1, batch.expand(1, rest)) == rest
+
+
+def test_idle_workers_go_to_the_remaining_host():
+    batch = make_batch(per_host_limit=2, max_workers=6, pages=(20, 1, 1))
+    running = dispatch(batch, 0)
+    assert batch.in_flight == {"a.example.com": 4, "b.example.com": 1, "c.example.com": 1}
+
+    # The small sites finish; their workers move to the large one
+    for host in ("b.example.com", "c.example.com"):
+        batch.in_flight[host] -= 1
+        running -= 1
+    dispatch(batch, running)
+    assert batch.in_flight["a.example.com"] == 6
+
+
+def test_single_site_batch_uses_the_whole_pool():
+    batch = BatchScraper(["https://a.example.com/"], max_workers=8, per_host_limit=2)
+    batch.outstanding[1] = 0
+    for i in range(20):
+        batch.enqueue(1, f"https://a.example.com/page{i}")
+    dispatch(batch, 0)
+    assert batch.in_flight["a.example.com"] == 8
+
+
+def test_run_crawls_every_site_and_writes_a_summary(serve, tmp_path):
+    big = serve({
+        "/": "".join(f"<a href='/page{i}'>Page {i}</a>" for i in range(6)) + "<a href='/missing'>gone</a>",
+        **{f"/page{i}": f"<main><p>Big page {i}</p></main>" for i in range(6)},
+    })
+    small = serve({"/": "<a href='/only'>Only</a>", "/only": "<main><p>Small page</p></main>"})
+    # Nothing listens on port 1
+    unreachable = "http://127.0.0.1:1/"
+
+    batch = BatchScraper([big, small, unreachable], max_workers=4, output_dir=str(tmp_path))
+    completed = []
+    batch.batch_completed.connect(completed.append)
+    batch.run()
+
+    summary, = completed
+    assert summary["sites"] == 3
+    assert summary["pages"] == 7
+    assert all(count == 0 for count in batch.outstanding.values())
+    # Finished sites are released as soon as their files are written
+    assert batch.sites == {}
+
+    big_entry, small_entry, failed_entry = summary["results"]
+    assert big_entry["start_url"] == big
+    assert big_entry["pages"] == 6
+    assert big_entry["failed"] == [f"{big}missing"]
+    assert small_entry["pages"] == 1
+    assert small_entry["failed"] == []
+    assert failed_entry["pages"] == 0
+    assert failed_entry["discovery_error"]
+    assert failed_entry["failed"] == [unreachable]
+
+    json_path, txt_path = map(Path, small_entry["files"])
+    assert json.loads(json_path.read_text(encoding="utf-8"))[0]["content"] == "Small page"
+    assert "Small page" in txt_path.read_text(encoding="utf-8")
+    assert json.loads(Path(summary["summary_file"]).read_text(encoding="utf-8"))["pages"] == 7
@@ -0,0 +1,88 @@
+import pytest
+
+bs4 = pytest.importorskip("bs4")
+
+from boilerplate import BoilerplateFilter, split_blocks  # noqa: E402
+
+NAV = "<nav><ul><li><a href='/a'>Home</a></li><li><a href='/b'>Guide</a></li></ul></nav>"
+FOOTER = "<footer><p>Copyright 2026 Example Corp. All rights reserved.</p></footer>"
+
+
+class Record:
+    content = None
+
+
+def page(index):
+    html = f"<body>{NAV}<div><h1>Page {index}</h1><p>Unique text of page {index}.</p></div>{FOOTER}</body>"
+    return bs4.BeautifulSoup(html, "html.parser").body
+
+
+def test_split_blocks_keeps_document_order_and_skips_scripts():
+    root = bs4.BeautifulSoup(
+        "<body>intro<p>one <b>bold</b></p><script>var x;</script><p>two</p></body>", "html.parser"
+    ).body
+    assert [text for _, text in split_blocks(root)] == ["intro", "one bold", "two"]
+
+
+def test_learned_chrome_is_removed_from_all_pages():
+    learner = BoilerplateFilter(learn_pages=4)
+    records = []
+    for index in range(6):
+        record = Record()
+        learner.extract(record, page(index))
+        records.append(record)
+
+    for index, record in enumerate(records):
+        assert record.content == f"Page {index} Unique text of page {index}."
+
+
+def test_finish_learns_from_short_crawls():
+    learner = BoilerplateFilter(learn_pages=10, min_pages=3)
+    records = [Record() for _ in range(3)]
+    for index, record in enumerate(records):
+        learner.extract(record, page(index))
+    assert "Copyright" in records[0].content
+
+    assert learner.finish() > 0
+    assert all("Copyright" not in record.content for record in records)
+
+
+def test_finish_keeps_everything_below_min_pages():
+    learner = BoilerplateFilter(learn_pages=10, min_pages=3)
+    record = Record()
+    learner.extract(record, page(0))
+    assert learner.finish() == 0
+    assert "Copyright" in record.content
+
+
+def test_repeated_headings_and_short_labels_are_kept():
+    learner = BoilerplateFilter(learn_pages=3)
+    records = [Record() for _ in range(4)]
+    for index, record in enumerate(records):
+        html = (
+            f"<body>{NAV}<h2>func_{index}()</h2><p>Does thing {index}.</p>"
+            "<h3>Parameters</h3><p class='rubric'>Returns</p><div>Example</div>"
+            f"<p>Returns value {index}.</p>{FOOTER}</body>"
+        )
+        learner.extract(record, bs4.BeautifulSoup(html, "html.parser").body)
+
+    for index, record in enumerate(records):
+        assert record.content == (
+            f"func_{index}() Does thing {index}. Parameters Returns Example Returns value {index}."
+        )
+
+
+def test_short_link_blocks_are_still_boilerplate():
+    root = bs4.BeautifulSoup(
+        "<body><p><a href='/e'>Edit on GitHub</a></p><p>Note</p></body>", "html.parser"
+    ).body
+    (link_fingerprint, _), (note_fingerprint, _) = split_blocks(root)
+    assert link_fingerprint is not None
+    assert note_fingerprint is None
+
+
+def test_split_blocks_handles_deep_nesting():
+    html = "<body>" + "<div>" * 1200 + "deep text" + "</div>" * 1200 + "</body>"
+    root = bs4.BeautifulSoup(html, "html.parser").body
+    blocks = split_blocks(root)
+    assert [text for _, text in blocks] == ["deep text"]
@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("bs4")
+
+from scraper import DocScraper  # noqa: E402
+
+
+def test_single_site_links_go_through_the_compact_set(serve):
+    root = serve({
+        "/": "<a href='/a'>A</a><a href='/a#part'>A again</a><a href='/b'>B</a><a href='/b/'>B dir</a>",
+        "/a": "<main><p>Page A</p></main>",
+        "/b": "<main><p>Page B</p></main>",
+    })
+    scraper = DocScraper(root, max_workers=2)
+    links = scraper.discover_links()
+
+    assert sorted(links) == [f"{root}a", f"{root}b", f"{root}b/"]
+    assert len(scraper.visited_links) == 3
+    assert all(link in scraper.visited_links for link in links)
+    # Already seen links are not handed out again
+    assert scraper.get_links(root) == []
+
+    completed = []
+    progress = []
+    scraper.scraping_completed.connect(completed.append)
+    scraper.progress_updated.connect(lambda current, total: progress.append((current, total)))
+    scraper.scrape_selected(links)
+    pages, = completed
+    # /b/ is a 404; it still counts towards progress
+    assert sorted(page.content for page in pages) == ["Page A", "Page B"]
+    assert progress[-1] == (3, 3)
+
+
+def test_transfer_stats_cover_one_fetch_per_page_and_one_run(serve):
+    root = serve({"/": "<a href='/a'>A</a>", "/a": "<main><p>Page A</p></main>"})
+    scraper = DocScraper(root, max_workers=2)
+    links = scraper.discover_links()
+    # Detection and link extraction share one fetch of the start page
+    assert scraper.transport.stats.responses == 1
+
+    scraper.scrape_selected(links)
+    first = scraper.transport.stats.as_dict()
+    scraper.scrape_selected(links)
+    assert scraper.transport.stats.as_dict() == first
+    assert first["responses"] == 1
@@ -0,0 +1,102 @@
+import pytest
+
+pytest.importorskip("bs4")
+
+from sites import GENERIC, SITE_TYPES, Container, detect_site_type, parse_head  # noqa: E402
+
+
+def site_type(name):
+    return next(site_type for site_type in SITE_TYPES if site_type.name == name)
+
+
+@pytest.mark.parametrize("head, expected", [
+    ('<meta name="generator" content="Docusaurus v3.1.0">', "Docusaurus"),
+    ('<meta name="generator" content="mkdocs-1.5.3, mkdocs-material-9.4">', "MkDocs"),
+    ('<meta name="generator" content="Docutils 0.19"><script src="_static/doctools.js"></script>', "Sphinx"),
+    ('<link rel="stylesheet" href="_static/css/theme.css">', "ReadTheDocs"),
+    ('<link rel="stylesheet" href="/wp-content/themes/x/style.css">', "WordPress"),
+    ('<meta name="generator" content="GitBook 3.2.3">', "GitBook"),
+    ('<title>Plain</title>', "Generic"),
+    # Hosted on Read the Docs, but the generator says what built it
+    ('<meta name="generator" content="Docusaurus v3.1.0"><script src="/_/static/javascript/readthedocs-addons.js">'
+     '</script>', "Docusaurus"),
+    ('<meta name="generator" content="GitBook 3.2.3"><script src="https://assets.readthedocs.org/x.js"></script>',
+     "GitBook"),
+    ('<meta name="generator" content="Sphinx 7.2"><link href="_static/css/theme.css">', "Sphinx"),
+])
+def test_detect_site_type(head, expected):
+    html = f"<html><head>{head}</head><body></body></html>"
+    assert detect_site_type(parse_head(html)).name == expected
+
+
+def test_detection_keeps_no_state_between_sites():
+    # Two projects on one host, e.g. user.github.io/a and user.github.io/b
+    wordpress = '<html><head><link href="/a/wp-content/x.css"></head></html>'
+    plain = '<html><head><title>b</title></head></html>'
+    assert detect_site_type(parse_head(wordpress)).name == "WordPress"
+    assert detect_site_type(parse_head(plain)) is GENERIC
+
+
+def test_container_matches_class_token_and_nesting():
+    html = '<div class="bodyx">no</div><div class="a body"><div>inner</div>text</div><div>after</div>'
+    assert Container("div", {"class": "body"}).find(html) == '<div class="a body"><div>inner</div>text</div>'
+
+
+def test_sphinx_extract_renders_markdown_from_container_only():
+    html = (
+        '<html><head><title>T</title></head><body>'
+        '<div class="sphinxsidebar"><ul><li>Sidebar link</li></ul></div>'
+        '<div class="body" role="main">'
+        '<h1>Install<a class="headerlink" href="#i">¶</a></h1>'
+        '<p>Use <code>pip</code> to install.</p>'
+        '<pre>pip install foo\nfoo --help</pre>'
+        '<ul><li>One<ul><li>Nested</li></ul></li><li>Two</li></ul>'
+        '<table><tr><th>Opt</th><th>Meaning</th></tr><tr><td>-v</td><td>verbose</td></tr></table>'
+        '</div><div class="footer">Footer</div></body></html>'
+    )
+    assert site_type("Sphinx").extract(html) == (
+        "# Install\n\n"
+        "Use pip to install.\n\n"
+        "```\npip install foo\nfoo --help\n```\n\n"
+        "- One\n  - Nested\n- Two\n\n"
+        "Opt | Meaning\n--- | ---\n-v | verbose"
+    )
+
+
+def test_extract_returns_none_without_container():
+    assert site_type("Docusaurus").extract("<html><body><p>x</p></body></html>") is None
+    assert GENERIC.extract("<html><body><p>x</p></body></html>") is None
+
+
+def test_container_ignores_tags_inside_scripts():
+    html = (
+        '<div role="main"><script>var x="<div>";</script><p>body</p></div>'
+        '<div class="footer">FOOTER junk</div>'
+    )
+    assert site_type("Sphinx").extract(html) == "body"
+
+
+def test_container_ignores_tags_inside_comments_and_styles():
+    html = (
+        '<!-- <div role="main">old</div> -->'
+        '<div role="main"><!-- </div> --><style>div:after{content:"</div>"}</style>'
+        '<p>keep</p><p>this</p></div><div>after</div>'
+    )
+    assert site_type("Sphinx").extract(html) == "keep\n\nthis"
+
+
+def test_line_breaks_and_adjacent_inline_elements_keep_separators():
+    html = (
+        '<div role="main"><p>line one<br>line two<br/><span>three<br>four</span></p>'
+        '<p><code>alpha</code><code>beta</code> done</p></div>'
+    )
+    assert site_type("Sphinx").extract(html) == "line one\nline two\nthree\nfour\n\nalpha beta done"
+
+
+def test_extract_handles_deep_nesting():
+    spans = "<span>" * 1500 + "deep text" + "</span>" * 1500
+    lists = "<ul><li>level" * 300 + "</li></ul>" * 300
+    html = f'<div class="body">{spans}{lists}</div>'
+    content = site_type("Sphinx").extract(html)
+    assert content.startswith("deep text\n\n- level\n  - level\n")
+    assert content.endswith(f"{'  ' * 299}- level")
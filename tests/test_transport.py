@@ -0,0 +1,44 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from transport import HTTP2_AVAILABLE, make_transport
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b"<html><body>hello</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("http2", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not HTTP2_AVAILABLE, reason="httpx[http2] not installed")),
+])
+def test_transport_is_usable_again_after_close(server_url, http2):
+    transport = make_transport(http2)
+    assert "hello" in transport.get(server_url)
+    transport.close()
+
+    # A rerun of the same scraper reuses its closed transport
+    assert "hello" in transport.get(server_url)
+    transport.close()
+    assert transport.stats.responses == 2
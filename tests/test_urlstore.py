@@ -0,0 +1,63 @@
+import os
+
+from urlstore import CompactUrlSet, normalize_url, split_url
+
+
+def test_split_url_normalizes_scheme_host_port_and_fragment():
+    assert split_url("HTTPS://Docs.Example.com:443/Guide/Page?x=1#top") == (
+        "https://docs.example.com", "/Guide/Page?x=1"
+    )
+
+
+def test_split_url_keeps_non_default_port():
+    assert split_url("http://example.com:8080/a") == ("http://example.com:8080", "/a")
+
+
+def test_normalize_url_adds_root_path():
+    assert normalize_url("http://example.com") == "http://example.com/"
+    assert normalize_url(" http://example.com:80#x ") == "http://example.com/"
+
+
+def test_add_reports_new_urls_only_once():
+    urls = CompactUrlSet()
+    assert urls.add("https://example.com/a")
+    assert not urls.add("https://EXAMPLE.com/a#section")
+    assert len(urls) == 1
+    urls.close()
+
+
+def test_membership_survives_filter_growth():
+    urls = CompactUrlSet(capacity=50)
+    added = [f"https://site{i % 3}.example.com/page/{i}" for i in range(500)]
+    assert all(urls.add(url) for url in added)
+
+    assert len(urls.filters) > 1
+    assert len(urls) == 500
+    assert all(url in urls for url in added)
+    assert not any(f"https://site0.example.com/other/{i}" in urls for i in range(500))
+    assert sorted(urls) == sorted(added)
+    urls.close()
+
+
+def test_grown_filters_get_tighter_error_rates():
+    urls = CompactUrlSet(capacity=10)
+    for i in range(200):
+        urls.add(f"https://example.com/{i}")
+    bits_per_url = [bloom.size / bloom.capacity for bloom in urls.filters]
+    assert bits_per_url == sorted(bits_per_url)
+    assert bits_per_url[-1] > bits_per_url[0]
+    urls.close()
+
+
+def test_close_removes_store_and_empties_set():
+    urls = CompactUrlSet()
+    urls.add("https://example.com/a")
+    path = urls.path
+    assert os.path.exists(path)
+
+    urls.close()
+    assert not os.path.exists(path)
+    assert len(urls) == 0
+    assert "https://example.com/a" not in urls
+    assert urls.add("https://example.com/a")
+    urls.close()